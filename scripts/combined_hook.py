@@ -5,56 +5,60 @@ Routes to appropriate subagent based on flag detection.
 """
 
 import json
+import re
 import sys
-import subprocess
 import os
 
+# orjson parses bytes several times faster than stdlib json; this runs
+# synchronously in front of every prompt, so use it when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Make sibling hook modules importable so dispatch stays in-process
+# (avoids a python3 re-spawn per prompt on the UserPromptSubmit path)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+def load_hook_input():
+    """Parse the hook payload from stdin (raw bytes when orjson is available)."""
+    if orjson is not None:
+        return orjson.loads(sys.stdin.buffer.read())
+    return json.load(sys.stdin)
+
+def dump_hook_output(output):
+    """Serialize a hook output dict to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(output).decode()
+    return json.dumps(output)
+
+# One pass over the prompt to pick a route: -t[scope] must end the prompt
+# (mirrors t_flag_hook's parser) while -i/-ic[size] may appear anywhere
+# (mirrors i_flag_hook's parser)
+_FLAG_RE = re.compile(r'(?:^|\s)-(t)[a-zA-Z0-9_-]*\s*$|-(i)c?\d*(?:\s|$)')
+
 def main():
     """Process UserPromptSubmit hook for both -i and -t flags."""
     try:
         # Read hook input
-        input_data = json.load(sys.stdin)
+        input_data = load_hook_input()
         prompt = input_data.get('prompt', '')
 
-        # Check for test flag first (-t)
-        if '-t' in prompt and (prompt.strip().endswith('-t') or ' -t' in prompt):
-            # Route to test hook
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            test_hook_path = os.path.join(script_dir, 't_flag_hook.py')
-
-            # Execute test hook with the same input
-            result = subprocess.run(
-                ['python3', test_hook_path],
-                input=json.dumps(input_data),
-                text=True,
-                capture_output=True
-            )
-
-            if result.stdout:
-                print(result.stdout, end='')
-            if result.stderr:
-                print(result.stderr, file=sys.stderr, end='')
-            sys.exit(result.returncode)
-
-        # Check for index flag (-i)
-        elif '-i' in prompt:
-            # Route to index hook
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            index_hook_path = os.path.join(script_dir, 'i_flag_hook.py')
+        # Single scan to detect which flag (if any) is present
+        match = _FLAG_RE.search(prompt)
+        flag = (match.group(1) or match.group(2)) if match else None
 
-            # Execute index hook with the same input
-            result = subprocess.run(
-                ['python3', index_hook_path],
-                input=json.dumps(input_data),
-                text=True,
-                capture_output=True
-            )
+        if flag == 't':
+            # Route to test hook in-process
+            import t_flag_hook
+            sys.exit(t_flag_hook.run(input_data))
 
-            if result.stdout:
-                print(result.stdout, end='')
-            if result.stderr:
-                print(result.stderr, file=sys.stderr, end='')
-            sys.exit(result.returncode)
+        elif flag == 'i':
+            # Route to index hook in-process
+            import i_flag_hook
+            sys.exit(i_flag_hook.run(input_data))
 
         # No recognized flags, let prompt proceed normally
         sys.exit(0)
@@ -66,7 +70,7 @@ def main():
                 "additionalContext": f"❌ Combined hook error: {str(e)}"
             }
         }
-        print(json.dumps(error_output), file=sys.stderr)
+        print(dump_hook_output(error_output), file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -563,19 +563,17 @@ Focus on providing actionable file locations and insights."""
         print(f"⚠️ Error preparing clipboard content: {e}", file=sys.stderr)
         return ('error', str(e))
 
-def main():
-    """Process UserPromptSubmit hook for -i and -ic flag detection."""
+def run(input_data):
+    """Process an already-parsed hook payload. Returns an exit code."""
     try:
-        # Read hook input
-        input_data = json.load(sys.stdin)
         prompt = input_data.get('prompt', '')
-        
+
         # Parse flag
         size_k, clipboard_mode, cleaned_prompt = parse_index_flag(prompt)
-        
+
         if size_k is None:
             # No index flag, let prompt proceed normally
-            sys.exit(0)
+            return 0
         
         # Find project root
         project_root = find_project_root()
@@ -588,7 +586,7 @@ def main():
             print(f"🔄 Regenerating index: {reason}", file=sys.stderr)
             if not generate_index_at_size(project_root, size_k, clipboard_mode):
                 print("⚠️ Proceeding without PROJECT_INDEX.json", file=sys.stderr)
-                sys.exit(0)
+                return 0
         else:
             print(f"✅ {reason}", file=sys.stderr)
         
@@ -766,14 +764,22 @@ PROJECT_INDEX.json location: {index_path}
             }
         
         print(json.dumps(output))
-        sys.exit(0)
-        
-    except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 0
+
     except Exception as e:
         print(f"Hook error: {e}", file=sys.stderr)
+        return 1
+
+def main():
+    """Process UserPromptSubmit hook for -i and -ic flag detection."""
+    try:
+        # Read hook input
+        input_data = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON input: {e}", file=sys.stderr)
         sys.exit(1)
 
+    sys.exit(run(input_data))
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -7,12 +7,18 @@ Handles workspace detection, prerequisite validation, and test execution with re
 import json
 import sys
 import os
+import mmap
+import re
+import selectors
 import subprocess
 import shutil
 from pathlib import Path
 from datetime import datetime
 import time
 
+# Seconds of output silence before scanning for freshly written reports
+REPORT_POLL_INTERVAL = 1.0
+
 class QATestRunner:
     def __init__(self, project_root, workspace=None, scope=None):
         self.project_root = Path(project_root)
@@ -22,8 +28,10 @@ class QATestRunner:
 
     def log(self, message, level="INFO"):
         """Log messages with timestamp."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] {level}: {message}")
+        # time.localtime is much cheaper than building a datetime per log
+        # line, which matters for runs emitting thousands of records
+        now = time.localtime()
+        print(f"[{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}] {level}: {message}")
 
     def check_prerequisites(self):
         """Verify all prerequisites before running tests."""
@@ -33,7 +41,7 @@ class QATestRunner:
         os.chdir(self.project_root)
 
         # 1. Check node_modules and run bootstrap
-        if not (self.project_root / 'node_modules').exists():
+        if not os.path.isdir(os.path.join(self.project_root, 'node_modules')):
             self.log("📦 node_modules not found, running npm run bootstrap...")
             try:
                 subprocess.run(['npm', 'run', 'bootstrap'], check=True, capture_output=True)
@@ -48,24 +56,38 @@ class QATestRunner:
             self.log("❌ .env file not found at repo root", "ERROR")
             return False
 
-        # Check required environment variables
+        # Check required and optional environment variables in one scan:
+        # a single alternation regex matches every VAR= assignment in one
+        # pass over the file instead of one substring walk per variable
         required_vars = ['BASE_URL']
-        with open(env_file) as f:
-            env_content = f.read()
+        optional_vars = ['ANDROID_APP_PATH', 'ELECTRON_APP_PATH']
 
-        missing_vars = []
-        for var in required_vars:
-            if f'{var}=' not in env_content:
-                missing_vars.append(var)
+        pattern = re.compile(
+            b'^(' + b'|'.join(re.escape(var.encode()) for var in required_vars + optional_vars) + b')=',
+            re.MULTILINE
+        )
 
+        # Scan the file through mmap as raw bytes: the regex runs over the
+        # kernel's page-cache mapping, with no decode and no str copy
+        found_vars = set()
+        with open(env_file, 'rb') as f:
+            try:
+                env_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                env_map = None  # empty file cannot be mapped
+            if env_map is not None:
+                try:
+                    found_vars = {match.group(1).decode() for match in pattern.finditer(env_map)}
+                finally:
+                    env_map.close()
+
+        missing_vars = [var for var in required_vars if var not in found_vars]
         if missing_vars:
             self.log(f"❌ Missing required environment variables: {', '.join(missing_vars)}", "ERROR")
             return False
 
-        # Check optional but recommended variables
-        optional_vars = ['ANDROID_APP_PATH', 'ELECTRON_APP_PATH']
         for var in optional_vars:
-            if f'{var}=' not in env_content:
+            if var not in found_vars:
                 self.log(f"⚠️ Optional environment variable {var} not set", "WARN")
 
         self.log("✅ .env file validated")
@@ -136,25 +158,52 @@ class QATestRunner:
         self.log(f"🧪 Executing: {' '.join(command)}")
 
         try:
-            # Execute test command with streaming output
+            # Execute test command with streaming output. Read the raw pipe in
+            # large chunks and split on newlines ourselves - text-mode
+            # readline() pays a syscall plus decode per log line, which adds up
+            # over the tens of thousands of lines a Playwright run emits.
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                bufsize=0
             )
 
-            output_lines = []
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    print(output.strip())
-                    output_lines.append(output.strip())
+            # Wait on pipe readiness rather than blocking in os.read so the
+            # idle stretches of a long Playwright run can be spent polling for
+            # reports as they are written instead of only after exit
+            fd = process.stdout.fileno()
+            selector = selectors.DefaultSelector()
+            selector.register(process.stdout, selectors.EVENT_READ)
 
-            exit_code = process.poll()
+            output_lines = []
+            pending = b''
+            seen_reports = set()
+            try:
+                while True:
+                    events = selector.select(timeout=REPORT_POLL_INTERVAL)
+                    if not events:
+                        # Child is quiet - look for reports written so far
+                        self.poll_new_reports(seen_reports)
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    lines = (pending + chunk).split(b'\n')
+                    pending = lines.pop()
+                    for raw_line in lines:
+                        line = raw_line.decode('utf-8', 'replace').strip()
+                        print(line)
+                        output_lines.append(line)
+            finally:
+                selector.close()
+
+            if pending:
+                line = pending.decode('utf-8', 'replace').strip()
+                print(line)
+                output_lines.append(line)
+
+            exit_code = process.wait()
 
             # Note: Retry logic is built into the npm scripts via Playwright config
             # No need for additional retries here
@@ -174,34 +223,55 @@ class QATestRunner:
         except Exception as e:
             return 1, [str(e)]
 
+    def poll_new_reports(self, seen_reports):
+        """Log HTML reports as they appear while tests are still running."""
+        for workspace in ['wingspanai-web', 'smartscreen', 'wingspanai-mobile']:
+            report_base = os.path.join(self.project_root, workspace, 'test-reports')
+            if not os.path.isdir(report_base):
+                continue
+            with os.scandir(report_base) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    html_report = os.path.join(entry.path, 'html-report', 'index.html')
+                    if html_report not in seen_reports and os.path.isfile(html_report):
+                        seen_reports.add(html_report)
+                        self.log(f"📋 Report available: {html_report}")
+
     def generate_report_summary(self, exit_code, output_lines):
         """Generate a summary of test results and report locations."""
         status = "✅ PASSED" if exit_code == 0 else "❌ FAILED"
         self.log(f"🏁 Test execution completed: {status}")
 
-        # Find report directories based on actual project structure
+        # Find report directories based on actual project structure.
+        # os.scandir serves is_dir() from the directory listing itself,
+        # so old session directories don't cost one stat() each
         report_paths = []
 
         # Check for test-reports directories in each workspace
         for workspace in ['wingspanai-web', 'smartscreen', 'wingspanai-mobile']:
-            report_base = self.project_root / workspace / 'test-reports'
-            if report_base.exists():
-                for report_dir in report_base.iterdir():
-                    if report_dir.is_dir():
-                        # Look for HTML reports
-                        html_report = report_dir / 'html-report' / 'index.html'
-                        if html_report.exists():
-                            report_paths.append(str(html_report))
-                        else:
-                            # Include directory even without HTML report
-                            report_paths.append(str(report_dir))
+            report_base = os.path.join(self.project_root, workspace, 'test-reports')
+            if not os.path.isdir(report_base):
+                continue
+            with os.scandir(report_base) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    # Look for HTML reports
+                    html_report = os.path.join(entry.path, 'html-report', 'index.html')
+                    if os.path.isfile(html_report):
+                        report_paths.append(html_report)
+                    else:
+                        # Include directory even without HTML report
+                        report_paths.append(entry.path)
 
         # Also check root test-reports
-        root_reports = self.project_root / 'test-reports'
-        if root_reports.exists():
-            for report_dir in root_reports.iterdir():
-                if report_dir.is_dir():
-                    report_paths.append(str(report_dir))
+        root_reports = os.path.join(self.project_root, 'test-reports')
+        if os.path.isdir(root_reports):
+            with os.scandir(root_reports) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        report_paths.append(entry.path)
 
         # Generate summary
         summary = {
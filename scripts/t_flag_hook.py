@@ -4,6 +4,7 @@ UserPromptSubmit hook for QA Test Runner subagent.
 Detects -t[scope] flags for intelligent test execution.
 """
 
+import functools
 import json
 import sys
 import os
@@ -12,8 +13,32 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
+# orjson parses bytes several times faster than stdlib json; this runs
+# synchronously in front of every prompt, so use it when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_hook_input():
+    """Parse the hook payload from stdin (raw bytes when orjson is available)."""
+    if orjson is not None:
+        return orjson.loads(sys.stdin.buffer.read())
+    return json.load(sys.stdin)
+
+def dump_hook_output(output):
+    """Serialize a hook output dict to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(output).decode()
+    return json.dumps(output)
+
+@functools.lru_cache(maxsize=1)
 def find_project_root():
-    """Find project root by looking for .git or common project markers."""
+    """Find project root by looking for .git or common project markers.
+
+    Cached - the walk stats .git in every ancestor and the result is used
+    several times per hook invocation.
+    """
     current = Path.cwd()
 
     # First check current directory for project markers
@@ -34,14 +59,26 @@ def find_project_root():
     # Default to current directory
     return current
 
+# Match -t followed by optional scope; compiled once so the hot hook path
+# skips re's per-call cache lookup
+_TEST_FLAG_RE = re.compile(r'\s+-t([a-zA-Z0-9_-]*)\s*$', re.ASCII)
+
+# Known workspaces in test-preference order, with the byte prefixes their
+# paths carry in git status --porcelain output
+WORKSPACES = ('wingspanai-web', 'smartscreen', 'wingspanai-mobile')
+_WORKSPACE_PREFIXES = tuple((ws, (ws + '/').encode()) for ws in WORKSPACES)
+
 def parse_test_flag(prompt):
     """
     Parse test flags from prompt: -t, -tsmoke, -tregression, etc.
     Returns: (scope, cleaned_prompt) or (None, prompt)
     """
-    # Match -t followed by optional scope
-    pattern = r'\s+-t([a-zA-Z0-9_-]*)\s*$'
-    match = re.search(pattern, prompt)
+    # Fast reject: most prompts carry no flag, and the C-level substring
+    # scan is far cheaper than setting up the regex match
+    if '-t' not in prompt:
+        return None, prompt
+
+    match = _TEST_FLAG_RE.search(prompt)
 
     if match:
         scope = match.group(1) if match.group(1) else None
@@ -59,32 +96,31 @@ def detect_workspace_changes():
         project_root = find_project_root()
         os.chdir(project_root)
 
-        # Check git status for changed files
+        # Check git status for changed files; keep the output as bytes -
+        # paths that match no workspace never need decoding
         result = subprocess.run(['git', 'status', '--porcelain'],
-                              capture_output=True, text=True, check=True)
-
-        changed_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-
-        # Analyze file paths to determine workspace
-        wingspanai_web_files = any('wingspanai-web/' in file for file in changed_files)
-        smartscreen_files = any('smartscreen/' in file for file in changed_files)
-        mobile_files = any('wingspanai-mobile/' in file for file in changed_files)
-
-        if wingspanai_web_files:
-            return 'wingspanai-web'
-        elif smartscreen_files:
-            return 'smartscreen'
-        elif mobile_files:
-            return 'wingspanai-mobile'
+                              capture_output=True, check=True)
+
+        # One pass over the status lines: porcelain output is 'XY path', so
+        # an anchored prefix compare at column 3 replaces a substring scan
+        # per workspace per line
+        hits = set()
+        for line in result.stdout.splitlines():
+            path = line[3:]
+            for workspace, prefix in _WORKSPACE_PREFIXES:
+                if path.startswith(prefix):
+                    hits.add(workspace)
+                    break
+
+        for workspace in WORKSPACES:
+            if workspace in hits:
+                return workspace
 
         # Check current working directory as fallback
-        cwd = Path.cwd()
-        if 'wingspanai-web' in str(cwd):
-            return 'wingspanai-web'
-        elif 'smartscreen' in str(cwd):
-            return 'smartscreen'
-        elif 'wingspanai-mobile' in str(cwd):
-            return 'wingspanai-mobile'
+        cwd = str(Path.cwd())
+        for workspace in WORKSPACES:
+            if workspace in cwd:
+                return workspace
 
         return None
 
@@ -110,11 +146,9 @@ def get_test_command(workspace, scope):
             return f'npm run test:{scope}'
         return 'npm run test:smoke'
 
-def main():
-    """Process UserPromptSubmit hook for -t flag detection."""
+def run(input_data):
+    """Process an already-parsed hook payload. Returns an exit code."""
     try:
-        # Read hook input
-        input_data = json.load(sys.stdin)
         prompt = input_data.get('prompt', '')
 
         # Parse test flag
@@ -122,7 +156,7 @@ def main():
 
         if scope is None:
             # No test flag, let prompt proceed normally
-            sys.exit(0)
+            return 0
 
         # Detect workspace
         workspace = detect_workspace_changes()
@@ -170,8 +204,24 @@ DO NOT execute tests directly - use the specialized QA Test Runner subagent.
             }
         }
 
-        print(json.dumps(output))
+        print(dump_hook_output(output))
+        return 0
+
+    except Exception as e:
+        error_output = {
+            "hookSpecificOutput": {
+                "hookEventName": "UserPromptSubmit",
+                "additionalContext": f"❌ QA Test Runner hook error: {str(e)}"
+            }
+        }
+        print(dump_hook_output(error_output), file=sys.stderr)
+        return 1
 
+def main():
+    """Process UserPromptSubmit hook for -t flag detection."""
+    try:
+        # Read hook input
+        input_data = load_hook_input()
     except Exception as e:
         error_output = {
             "hookSpecificOutput": {
@@ -179,8 +229,10 @@ DO NOT execute tests directly - use the specialized QA Test Runner subagent.
                 "additionalContext": f"❌ QA Test Runner hook error: {str(e)}"
             }
         }
-        print(json.dumps(error_output), file=sys.stderr)
+        print(dump_hook_output(error_output), file=sys.stderr)
         sys.exit(1)
 
+    sys.exit(run(input_data))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file